@@ -1,7 +1,5 @@
 import streamlit as st
 import data_io, llm_utils, web_search
-import difflib
-import pandas as pd
 
 # ---------- ページ設定 ----------
 st.set_page_config(page_title="Consulting Demo App", layout="wide")
@@ -63,6 +61,8 @@ init_state()
 # ---------- Helpers ----------
 def show_diff_table(old: str, new: str):
     """差分を表形式で見やすく表示"""
+    import difflib
+    import pandas as pd
     diff = difflib.ndiff(old.splitlines(), new.splitlines())
     removed, added = [], []
     for line in diff:
@@ -76,6 +76,10 @@ def show_diff_table(old: str, new: str):
     })
     st.table(df.style.set_properties(**{'text-align': 'left'}))
 
+def render_card(card: dict):
+    """検索結果カードを1行で表示（検索中の逐次表示と結果一覧で共通）"""
+    st.markdown(f"- [{card['title']}]({card['url']}) ({card['source']})")
+
 def reset_downstream(*keys):
     for k in keys:
         st.session_state[k] = None
@@ -148,22 +152,46 @@ with st.container():
         with col1:
             if st.button("選択したワードで検索実行", disabled=len(edited_queries) == 0):
                 combined = {"cards": [], "summary": ""}
-                executed = []
-                for q in edited_queries:
-                    with st.spinner(f"検索中: {q}"):
-                        res = web_search.aggregate_search(q, max_results=5)
-                    if not res["cards"]:
-                        executed.append(q + "（スキップ）")
-                        continue
-                    combined["cards"].extend(res["cards"])
-                    if res["summary"]:
-                        combined["summary"] += ("\n" + res["summary"])
-                    executed.append(q)
-
+                executed = [q + "（未実行）" for q in edited_queries]
+                # 途中で止まっても、そこまでの結果で先に進めるよう逐次保存
                 st.session_state.search_results = combined
                 st.session_state.executed_queries = executed
                 reset_downstream("issues", "proposals", "judge", "slides")
 
+                live = st.empty()
+                with live.container():
+                    st.caption("取得できたものから表示します。")
+                    # 押すと再実行で検索が止まり、取得済みの結果で Step 4 以降が使えるようになる
+                    st.button("ここまでの結果で進める", key="proceed_partial")
+                    progress = st.empty()
+                    for i, q in enumerate(edited_queries):
+                        n_cards = 0
+                        base_summary = combined["summary"]
+                        executed[i] = q + "（中断）"
+                        progress.caption(f"検索中: {q}")
+                        for ev in web_search.iter_search_events(q, max_results=5):
+                            if ev["type"] == "discovered":
+                                progress.caption(f"検索中: {q}（{ev['total']}件ヒット）")
+                            elif ev["type"] == "fetched":
+                                progress.caption(f"取得中: {ev['url']}")
+                            elif ev["type"] == "extracted":
+                                progress.caption(f"要約中: {ev['url']}")
+                            elif ev["type"] == "summarized":
+                                card = ev["card"]
+                                combined["cards"].append(card)
+                                n_cards += 1
+                                # 外部要約ができるまでは各ドキュメント要約を仮のまとめにしておく
+                                if card["snippet"]:
+                                    combined["summary"] += ("\n- " + card["snippet"])
+                                render_card(card)
+                            elif ev["type"] == "corpus_summarized":
+                                progress.caption(f"まとめ作成完了: {q}")
+                                combined["summary"] = base_summary
+                                if n_cards and ev["summary"]:
+                                    combined["summary"] += ("\n" + ev["summary"])
+                        executed[i] = q if n_cards else q + "（スキップ）"
+                live.empty()
+
         with col2:
             if st.button("検索せずIBPデータのみで進める"):
                 st.session_state.search_results = {
@@ -176,7 +204,7 @@ with st.container():
     if st.session_state.search_results:
         st.markdown("**検索ワード:** " + ", ".join(st.session_state.executed_queries))
         for card in st.session_state.search_results["cards"]:
-            st.markdown(f"- [{card['title']}]({card['url']}) ({card['source']})")
+            render_card(card)
         st.markdown("**要点まとめ:**")
         st.write(st.session_state.search_results["summary"] or "_（業界情報なし）_")
     st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,128 @@
+"""
+コールドスタート（import時間）のベンチマーク。
+
+各計測対象（TARGETS）を新しいPythonプロセスで `python -X importtime -c "import <mods>"` し、
+  - 累積import時間が予算（ミリ秒）以内か
+  - 遅延読み込みにした重い依存（openai, pandas など）がimport時に読み込まれていないか
+をチェックする。どちらかに違反すると終了コード1を返す。
+
+使い方:
+  python bench_import.py                 # 全対象
+  python bench_import.py web_search app  # 指定した対象のみ
+  python bench_import.py --repeat 10     # 10回測って最小値で判定（既定5回）
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 計測対象 → 1プロセスでimportするモジュール。
+# app.py は `streamlit run` 用のページスクリプトでimportするとページ全体が実行されるため、
+# 代わりに app.py 先頭と同じimportの組み合わせを計測する。
+TARGETS = {
+    "data_io": ["data_io"],
+    "llm_utils": ["llm_utils"],
+    "web_search": ["web_search"],
+    "app": ["streamlit", "data_io", "llm_utils", "web_search"],
+}
+
+# ここに挙げたモジュールが単体で読み込む重い依存は許容する（自分たちでは制御できないため）
+BASE_IMPORTS = {
+    "app": ["streamlit"],
+}
+
+# 累積import時間の予算（ms）。README の実測ベースライン（最悪値）の約2倍、最低5ms。
+BUDGET_MS = {
+    "data_io": 5,
+    "llm_utils": 5,
+    "web_search": 40,
+    "app": 900,
+}
+
+# import時には読み込まれてはいけない重い依存
+LAZY_DEPS = ["openai", "pandas", "PyPDF2", "requests", "googlesearch", "bs4"]
+
+
+def _measure(modules: list[str]) -> tuple[float, list[str]]:
+    """
+    1プロセス分の計測。(累積import時間ms, import時に読み込まれた重い依存) を返す。
+    """
+    code = (
+        "import sys\n"
+        f"import {', '.join(modules)}\n"
+        f"print(','.join(m for m in {LAZY_DEPS!r} if m in sys.modules))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=HERE, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        err = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"{', '.join(modules)} のimportに失敗しました:\n{err[-2000:]}")
+
+    # 形式: "import time: self [us] | cumulative | imported package"
+    # 先頭インデント無しの行が -c から直接importされたモジュール。他の依存はその累積に含まれる。
+    cumulative_us = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) == 3 and parts[2][1:] in modules:
+            cumulative_us[parts[2][1:]] = int(parts[1])
+    if not cumulative_us:
+        raise RuntimeError(f"{', '.join(modules)} のimport時間を取得できませんでした")
+
+    out = proc.stdout.strip().splitlines()
+    loaded = [m for m in out[-1].split(",") if m] if out else []
+    return sum(cumulative_us.values()) / 1000, loaded
+
+
+def measure_target(target: str, repeat: int = 1) -> tuple[float, list[str]]:
+    """
+    TARGETS の1項目を repeat 回計測し、(最小の累積import時間ms, 許容外で読み込まれた重い依存) を返す。
+    """
+    runs = [_measure(TARGETS[target]) for _ in range(max(repeat, 1))]
+    best_ms = min(ms for ms, _ in runs)
+    loaded = {m for _, deps in runs for m in deps}
+    if target in BASE_IMPORTS:
+        loaded -= set(_measure(BASE_IMPORTS[target])[1])
+    return best_ms, sorted(loaded)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", default=list(TARGETS), help=f"計測対象（{', '.join(TARGETS)}）")
+    parser.add_argument("--repeat", type=int, default=5, help="計測回数（最小値で判定）")
+    args = parser.parse_args(argv)
+    unknown = [t for t in args.targets if t not in TARGETS]
+    if unknown:
+        parser.error(f"不明な計測対象: {', '.join(unknown)}")
+
+    failed = False
+    for target in args.targets:
+        try:
+            best_ms, loaded = measure_target(target, repeat=args.repeat)
+        except RuntimeError as e:
+            print(f"[ERROR] {e}")
+            failed = True
+            continue
+
+        budget = BUDGET_MS.get(target)
+        over = budget is not None and best_ms > budget
+        status = "FAIL" if over or loaded else "OK"
+        failed = failed or status == "FAIL"
+
+        line = f"[{status}] {target:<12} {best_ms:8.1f} ms"
+        if budget is not None:
+            line += f" (予算 {budget} ms)"
+        if loaded:
+            line += f"  import時に読み込まれた重い依存: {', '.join(loaded)}"
+        print(line)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,6 @@
-import pandas as pd
-from PyPDF2 import PdfReader
-
 def load_table(file) -> str:
     try:
+        import pandas as pd
         if file.name.endswith(("xls", "xlsx")):
             df = pd.read_excel(file)
         else:
@@ -12,6 +10,7 @@ def load_table(file) -> str:
         return f"読み込み失敗: {e}"
 
 def load_pdf(file) -> str:
+    from PyPDF2 import PdfReader
     reader = PdfReader(file)
     text = ""
     for page in reader.pages[:5]:
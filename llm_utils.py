@@ -1,11 +1,19 @@
 import os
-from openai import OpenAI
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+_client = None
+
+# ---------- OpenAI クライアント（初回呼び出し時に生成） ----------
+def get_client():
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
+
 
 # ---------- 共通 LLM 呼び出し ----------
 def call_llm(prompt: str, temperature: float = 0.7) -> str:
-    resp = client.chat.completions.create(
+    resp = get_client().chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": prompt}],
         temperature=temperature,
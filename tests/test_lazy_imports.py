@@ -0,0 +1,35 @@
+import importlib
+import importlib.util
+import sys
+import types
+
+import pytest
+
+import bench_import
+import llm_utils
+
+
+@pytest.mark.parametrize("target", list(bench_import.TARGETS))
+def test_no_heavy_deps_at_import(target):
+    for module in bench_import.TARGETS[target]:
+        if importlib.util.find_spec(module) is None:
+            pytest.skip(f"{module} がインストールされていない")
+    _, loaded = bench_import.measure_target(target)
+    assert loaded == []
+
+
+def test_get_client_created_once_on_first_call(monkeypatch):
+    created = []
+
+    class FakeOpenAI:
+        def __init__(self, api_key=None):
+            created.append(self)
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeOpenAI))
+    monkeypatch.setattr(llm_utils, "_client", None)
+    importlib.reload(llm_utils)
+    assert created == []
+
+    client = llm_utils.get_client()
+    assert llm_utils.get_client() is client
+    assert created == [client]
@@ -0,0 +1,75 @@
+import pytest
+
+import web_search
+
+
+class _Resp:
+    def __init__(self, ok=True, text="", content=b"", ctype="text/html"):
+        self.ok = ok
+        self.text = text
+        self.content = content
+        self.headers = {"Content-Type": ctype}
+
+
+def _stub(monkeypatch, urls, responses):
+    monkeypatch.setattr(web_search, "_google_urls", lambda query, k: urls[:k])
+    monkeypatch.setattr(web_search, "_fetch", lambda url: responses.get(url))
+    monkeypatch.setattr(web_search, "_extract_html_text", lambda html: html)
+    monkeypatch.setattr(web_search, "call_llm", lambda prompt, temperature=0.7: "要約")
+
+
+def test_iter_search_events_order(monkeypatch):
+    urls = ["https://a.example/", "https://b.example/"]
+    _stub(monkeypatch, urls, {urls[0]: _Resp(text="本文")})
+
+    events = list(web_search.iter_search_events("q", max_results=2))
+    assert [ev["type"] for ev in events] == [
+        "discovered", "discovered",
+        "fetched", "extracted", "summarized",
+        "fetched", "summarized",          # 取得失敗は抽出を飛ばしてタイトル要約
+        "corpus_summarized",
+    ]
+    assert events[0] == {"type": "discovered", "url": urls[0], "index": 0, "total": 2}
+    assert events[3]["kind"] == "html" and events[3]["chars"] == 2
+    assert events[5]["ok"] is False
+    assert events[4]["card"] == {"title": urls[0], "source": "Google", "url": urls[0], "snippet": "要約"}
+    assert events[-1]["summary"] == "要約"
+
+
+@pytest.mark.parametrize("url, ctype", [
+    ("https://a.example/report.PDF", "application/octet-stream"),
+    ("https://a.example/download?id=1", "application/pdf"),
+])
+def test_iter_search_events_pdf(monkeypatch, url, ctype):
+    resp = _Resp(text="<html></html>", content=b"%PDF-1.4", ctype=ctype)
+    _stub(monkeypatch, [url], {url: resp})
+    received = []
+    monkeypatch.setattr(web_search, "_extract_pdf_text", lambda content: received.append(content) or "PDF本文")
+
+    events = list(web_search.iter_search_events("q", max_results=1))
+    extracted = next(ev for ev in events if ev["type"] == "extracted")
+    assert extracted["kind"] == "pdf"
+    assert extracted["chars"] == len("PDF本文")
+    assert received == [resp.content]
+
+
+def test_aggregate_search_collects_events(monkeypatch):
+    urls = ["https://a.example/"]
+    _stub(monkeypatch, urls, {urls[0]: _Resp(text="本文")})
+
+    res = web_search.aggregate_search("q", max_results=3)
+    assert res == {
+        "cards": [{"title": urls[0], "source": "Google", "url": urls[0], "snippet": "要約"}],
+        "summary": "要約",
+    }
+
+
+def test_aggregate_search_fallback_when_no_urls(monkeypatch):
+    _stub(monkeypatch, [], {})
+
+    events = list(web_search.iter_search_events("q"))
+    assert events == [{"type": "corpus_summarized", "summary": "外部要約なし"}]
+
+    res = web_search.aggregate_search("q")
+    assert res["summary"] == "外部要約なし"
+    assert [c["source"] for c in res["cards"]] == ["Fallback"]
@@ -1,15 +1,24 @@
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Iterator
 from llm_utils import call_llm
-from googlesearch import search  # pip install googlesearch-python
-from PyPDF2 import PdfReader
-import requests
 from io import BytesIO
 
-# HTML本文抽出（bs4が無い場合はタイトル要約にフォールバック）
-try:
-    from bs4 import BeautifulSoup  # pip install beautifulsoup4
-    HAS_BS4 = True
-except Exception:
-    HAS_BS4 = False
+if TYPE_CHECKING:
+    import requests
+
+
+@functools.lru_cache(maxsize=None)
+def _get_bs4():
+    """
+    HTML本文抽出用（bs4が無い場合はNone → タイトル要約にフォールバック）
+    """
+    try:
+        from bs4 import BeautifulSoup  # pip install beautifulsoup4
+        return BeautifulSoup
+    except Exception:
+        return None
 
 
 USER_AGENT = (
@@ -47,6 +56,7 @@ def _google_urls(query: str, k: int) -> list[str]:
     """
     urls = []
     try:
+        from googlesearch import search  # pip install googlesearch-python
         for url in search(query, num_results=k, lang="ja"):
             urls.append(url)
             if len(urls) >= k:
@@ -62,6 +72,7 @@ def _is_pdf_url(url: str) -> bool:
 
 def _fetch(url: str) -> requests.Response | None:
     try:
+        import requests
         return requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=TIMEOUT, allow_redirects=True)
     except Exception:
         return None
@@ -69,6 +80,7 @@ def _fetch(url: str) -> requests.Response | None:
 
 def _extract_pdf_text(content: bytes) -> str:
     try:
+        from PyPDF2 import PdfReader
         reader = PdfReader(BytesIO(content))
         text_parts = []
         for page in reader.pages:
@@ -81,7 +93,8 @@ def _extract_pdf_text(content: bytes) -> str:
 
 
 def _extract_html_text(html: str) -> str:
-    if not HAS_BS4:
+    BeautifulSoup = _get_bs4()
+    if BeautifulSoup is None:
         return ""
     try:
         soup = BeautifulSoup(html, "html.parser")
@@ -143,52 +156,71 @@ def _summarize_corpus(internal_summary: str, doc_summaries: list[str]) -> str:
     return call_llm(prompt, temperature=0.3)
 
 
-def aggregate_search(query: str, max_results: int = MAX_DOCS) -> dict:
+def iter_search_events(query: str, max_results: int = MAX_DOCS) -> Iterator[dict]:
     """
-    検索 → （PDFは本文抽出 / HTMLは本文抽出）→ 各ドキュメント要約 → 外部要約
-    返り値:
-      {
-        "cards": [{"title","source","url","snippet"}...],
-        "summary": "<外部要約（複数ソースのまとめ）>"
-      }
+    aggregate_search のストリーミング版。処理の進行に合わせてイベント(dict)をyieldする。
+      {"type": "discovered", "url", "index", "total"}    … URL取得
+      {"type": "fetched", "url", "ok"}                   … ダウンロード完了
+      {"type": "extracted", "url", "kind", "chars"}      … 本文抽出完了（kind: "pdf"/"html"）
+      {"type": "summarized", "url", "card"}              … ドキュメント要約完了
+      {"type": "corpus_summarized", "summary"}           … 外部要約完了（最後に1回）
+    途中でイテレーションを止めれば、それまでの結果だけで先に進める。
     """
     urls = _google_urls(query, k=max_results)
-    cards = []
-    per_doc_summaries = []
+    for i, url in enumerate(urls):
+        yield {"type": "discovered", "url": url, "index": i, "total": len(urls)}
 
+    per_doc_summaries = []
     for url in urls:
-        title = url
-        source = "Google"
-        snippet = ""
-
-        # 1) PDF判定
-        if _is_pdf_url(url):
-            r = _fetch(url)
-            if r and r.ok:
-                text = _extract_pdf_text(r.content)
-                snippet = _summarize_doc(text, url)
+        r = _fetch(url)
+        ok = bool(r and r.ok)
+        yield {"type": "fetched", "url": url, "ok": ok}
+
+        if ok:
+            ctype = r.headers.get("Content-Type", "").lower()
+            if _is_pdf_url(url) or "pdf" in ctype:
+                kind, text = "pdf", _extract_pdf_text(r.content)
             else:
-                snippet = summarize_title(url)
+                kind, text = "html", _extract_html_text(r.text)
+            yield {"type": "extracted", "url": url, "kind": kind, "chars": len(text)}
+            snippet = _summarize_doc(text, url)
         else:
-            r = _fetch(url)
-            if r and r.ok:
-                ctype = r.headers.get("Content-Type", "").lower()
-                if "pdf" in ctype:
-                    text = _extract_pdf_text(r.content)
-                    snippet = _summarize_doc(text, url)
-                else:
-                    html_text = _extract_html_text(r.text) if HAS_BS4 else ""
-                    snippet = _summarize_doc(html_text, url)
-            else:
-                snippet = summarize_title(url)
+            snippet = summarize_title(url)
 
         per_doc_summaries.append(snippet)
-        cards.append({
-            "title": title[:80],
-            "source": source,
+        card = {
+            "title": url[:80],
+            "source": "Google",
             "url": url,
             "snippet": snippet
-        })
+        }
+        yield {"type": "summarized", "url": url, "card": card}
+
+    if per_doc_summaries:
+        # 外部要約（各ドキュメント要約の合体）
+        external_summary = _summarize_corpus("内部要約は別途参照", per_doc_summaries)
+    else:
+        external_summary = "外部要約なし"
+    yield {"type": "corpus_summarized", "summary": external_summary}
+
+
+def aggregate_search(query: str, max_results: int = MAX_DOCS) -> dict:
+    """
+    検索 → （PDFは本文抽出 / HTMLは本文抽出）→ 各ドキュメント要約 → 外部要約
+    iter_search_events を最後まで消費してまとめて返す。
+    返り値:
+      {
+        "cards": [{"title","source","url","snippet"}...],
+        "summary": "<外部要約（複数ソースのまとめ）>"
+      }
+    """
+    cards = []
+    external_summary = ""
+    for ev in iter_search_events(query, max_results=max_results):
+        if ev["type"] == "summarized":
+            cards.append(ev["card"])
+        elif ev["type"] == "corpus_summarized":
+            external_summary = ev["summary"]
 
     # 0件保険
     if not cards:
@@ -198,9 +230,5 @@ def aggregate_search(query: str, max_results: int = MAX_DOCS) -> dict:
             "url": "https://www.wikipedia.org/",
             "snippet": "検索結果が取得できませんでした。内部データのみで続行します。",
         }]
-        external_summary = "外部要約なし"
-    else:
-        # 外部要約（各ドキュメント要約の合体）
-        external_summary = _summarize_corpus("内部要約は別途参照", per_doc_summaries)
 
-    return {"cards": cards, "summary": external_summary}
\ No newline at end of file
+    return {"cards": cards, "summary": external_summary}